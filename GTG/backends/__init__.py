@@ -135,7 +135,7 @@ class BackendFactory(Borg):
 
             # Skip this backend if it doesn't have a module
             if not module:
-                log.debug(f"Could not load module for backend {module}")
+                log.debug("Could not load module for backend %s", backend)
                 continue
 
             backend_data = {}
@@ -115,21 +115,12 @@ class Backend(GenericBackend):
         filepath = self.get_path()
 
         if versioning.is_required(filepath):
-            log.warning('Found old file. Running versioning code.')
-            old_path = os.path.join(DATA_DIR, 'gtg_tasks.xml')
-            tree = versioning.convert(old_path, self.datastore)
-
-            xml.save_file(filepath, tree)
+            self._convert_old_file()
 
         elif not os.path.isfile(filepath):
-            root = firstrun_tasks.generate()
-            xml.create_dirs(self.get_path())
-            xml.save_file(self.get_path(), root)
+            self._write_first_run_file()
 
-        self.data_tree = xml.open_file(filepath, 'gtgData')
-        self.task_tree = self.data_tree.find('tasklist')
-        self.tag_tree = self.data_tree.find('taglist')
-        self.search_tree = self.data_tree.find('searchlist')
+        self._load_file()
 
         self.datastore.load_tag_tree(self.tag_tree)
         self.datastore.load_search_tree(self.search_tree)
@@ -151,24 +142,44 @@ class Backend(GenericBackend):
 
         filepath = self.get_path()
         if versioning.is_required(filepath):
-            log.warning('Found old file. Running versioning code.')
-            old_path = os.path.join(DATA_DIR, 'gtg_tasks.xml')
-            tree = versioning.convert(old_path, self.datastore)
-
-            xml.save_file(filepath, tree)
+            self._convert_old_file()
         else:
-            root = firstrun_tasks.generate()
-            xml.create_dirs(self.get_path())
-            xml.save_file(self.get_path(), root)
-
+            self._write_first_run_file()
 
         self._parameters[self.KEY_DEFAULT_BACKEND] = True
 
         # Load the newly created file
+        self._load_file()
+        xml.backup_used = None
+
+    def _convert_old_file(self) -> None:
+        """Convert the XML file of GTG versions before 0.5."""
+
+        log.warning('Found old file. Running versioning code.')
+        old_path = os.path.join(DATA_DIR, 'gtg_tasks.xml')
+        tree = versioning.convert(old_path, self.datastore)
+
+        xml.save_file(self.get_path(), tree)
+
+    def _write_first_run_file(self) -> None:
+        """Write a new XML file with the first run tasks."""
+
+        root = firstrun_tasks.generate()
+        xml.create_dirs(self.get_path())
+        xml.save_file(self.get_path(), root)
+
+    def _load_file(self) -> None:
+        """Open the XML file and find the task, tag and search lists."""
+
         self.data_tree = xml.open_file(self.get_path(), 'gtgData')
         self.task_tree = self.data_tree.find('tasklist')
         self.tag_tree = self.data_tree.find('taglist')
-        xml.backup_used = None
+        self.search_tree = self.data_tree.find('searchlist')
+
+        # Index task elements by id, so saving and removing a task doesn't
+        # need to search the whole task list
+        self._task_elements = {element.get('id'): element
+                               for element in self.task_tree.iter('task')}
 
     def start_get_tasks(self) -> None:
         """ This function starts submitting the tasks from the XML file into
@@ -199,14 +210,16 @@ class Backend(GenericBackend):
 
         tid = task.get_id()
         element = xml.task_to_element(task)
-        existing = self.task_tree.findall(f"task[@id='{tid}']")
+        existing = self._task_elements.get(tid)
 
-        if existing and element != existing[0]:
-            existing[0].getparent().replace(existing[0], element)
+        if existing is not None:
+            existing.getparent().replace(existing, element)
 
         else:
             self.task_tree.append(element)
 
+        self._task_elements[tid] = element
+
         # Write the xml
         xml.save_file(self.get_path(), self.data_tree)
 
@@ -217,16 +230,16 @@ class Backend(GenericBackend):
         @param tid: the id of the task to delete
         """
 
-        element = self.task_tree.findall(f'task[@id="{tid}"]')
+        element = self._task_elements.pop(tid, None)
 
-        if element:
-            element[0].getparent().remove(element[0])
+        if element is not None:
+            element.getparent().remove(element)
             xml.save_file(self.get_path(), self.data_tree)
 
     def save_tags(self, tagnames, tagstore) -> None:
         """Save changes to tags and saved searches."""
 
-        already_saved = []
+        already_saved = set()
         self.search_tree.clear()
 
         for tagname in tagnames:
@@ -235,25 +248,25 @@ class Backend(GenericBackend):
 
             tag = tagstore.get_node(tagname)
 
-            attributes = tag.get_all_attributes(butname=True, withparent=True)
+            attributes = tag.get_all_attributes(butname=True)
             if "special" in attributes:
                 continue
 
-            if tag.is_search_tag():
+            parent = tag.get_attribute('parent')
+            is_search = tag.is_search_tag()
+
+            if is_search:
                 root = self.search_tree
                 tag_type = 'savedSearch'
             else:
                 root = self.tag_tree
                 tag_type = 'tag'
 
-            tid = str(tag.tid)
-            element = root.findall(f'{tag_type}[@id="{tid}"]')
+            tid = tag.tid
+            element = root.find(f'{tag_type}[@id="{tid}"]')
 
-            if len(element) == 0:
-                element = et.SubElement(self.task_tree, tag_type)
-                root.append(element)
-            else:
-                element = element[0]
+            if element is None:
+                element = et.SubElement(root, tag_type)
 
             # Don't save the @ in the name
             element.set('id', tid)
@@ -266,7 +279,7 @@ class Backend(GenericBackend):
 
             for attr in attributes:
                 # skip labels for search tags
-                if tag.is_search_tag() and attr == 'label':
+                if is_search and attr == 'label':
                     continue
 
                 value = tag.get_attribute(attr)
@@ -276,7 +289,10 @@ class Backend(GenericBackend):
                         value = value[1:]
                     element.set(attr, value)
 
-            already_saved.append(tagname)
+            if parent:
+                element.set('parent', parent)
+
+            already_saved.add(tagname)
 
         xml.save_file(self.get_path(), self.data_tree)
 
@@ -298,6 +298,9 @@ class GenericBackend():
             lambda: self.please_quit)
         self.to_set = deque()
         self.to_remove = deque()
+        # Ids in the queues above, for constant time membership tests
+        self._to_set_ids = set()
+        self._to_remove_ids = set()
 
     def get_attached_tags(self):
         """
@@ -646,7 +649,8 @@ class GenericBackend():
             except IndexError:
                 break
             tid = task.get_id()
-            if tid not in self.to_remove:
+            self._to_set_ids.discard(tid)
+            if tid not in self._to_remove_ids:
                 self.set_task(task)
 
         while not self.please_quit or bypass_quit_request:
@@ -654,6 +658,7 @@ class GenericBackend():
                 tid = self.to_remove.pop()
             except IndexError:
                 break
+            self._to_remove_ids.discard(tid)
             self.remove_task(tid)
         # we release the weak lock
         self.to_set_timer = None
@@ -666,7 +671,8 @@ class GenericBackend():
         @param task: the task that should be saved
         """
         tid = task.get_id()
-        if task not in self.to_set and tid not in self.to_remove:
+        if tid not in self._to_set_ids and tid not in self._to_remove_ids:
+            self._to_set_ids.add(tid)
             self.to_set.appendleft(task)
             self.__try_launch_setting_thread()
 
@@ -678,7 +684,8 @@ class GenericBackend():
 
         @param tid: The Task ID of the task to be removed
         """
-        if tid not in self.to_remove:
+        if tid not in self._to_remove_ids:
+            self._to_remove_ids.add(tid)
             self.to_remove.appendleft(tid)
             self.__try_launch_setting_thread()
             return None
@@ -20,7 +20,7 @@ Contains the Datastore object, which is the manager of all the active backends
 (both enabled and disabled ones)
 """
 
-from collections import deque
+from collections import defaultdict, deque
 import threading
 import logging
 import uuid
@@ -111,6 +111,9 @@ class DataStore():
         self._tagstore.add_node(tag, parent_id=parent_id)
         tag.set_save_callback(self.save)
 
+        # Add to idmap for quick lookup based on ID
+        self.tag_idmap[tag.tid] = tag
+
     def new_tag(self, name, attributes={}, tid=None):
         """
         Create a new tag
@@ -152,6 +155,12 @@ class DataStore():
     def remove_tag(self, name):
         """ Removes a tag from the tagtree """
         if self._tagstore.has_node(name):
+            tag = self._tagstore.get_node(name)
+
+            # A renamed tag hands its ID over to the new one
+            if self.tag_idmap.get(tag.tid) is tag:
+                del self.tag_idmap[tag.tid]
+
             self._tagstore.del_node(name)
             self.save_tagtree()
         else:
@@ -186,7 +195,11 @@ class DataStore():
 
                 # Restore attributes on tag
                 new_tag = self.get_tag(newname)
-                new_tag.tid = tid
+
+                if new_tag.tid != tid:
+                    self.tag_idmap.pop(new_tag.tid, None)
+                    new_tag.tid = tid
+                    self.tag_idmap[tid] = new_tag
 
                 if color:
                     new_tag.set_attribute("color", color)
@@ -229,13 +242,17 @@ class DataStore():
         Loads the tag tree from a xml file
         """
 
+        # Children whose parent hasn't been loaded yet, by parent name
+        pending_children = defaultdict(list)
+
         for element in tag_tree.iter('tag'):
-            tid = element.get('id')
-            name = element.get('name')
-            color = element.get('color')
-            icon = element.get('icon')
-            parent = element.get('parent')
-            nonactionable = element.get('nonactionable')
+            get = element.get
+            tid = get('id')
+            name = get('name')
+            color = get('color')
+            icon = get('icon')
+            parent = get('parent')
+            nonactionable = get('nonactionable')
 
             tag_attrs = {}
 
@@ -251,10 +268,13 @@ class DataStore():
             tag = self.new_tag(name, tag_attrs, tid)
 
             if parent:
-                tag.set_parent(parent)
+                if self._tagstore.has_node(parent):
+                    tag.set_parent(parent)
+                else:
+                    pending_children[parent].append(tag)
 
-            # Add to idmap for quick lookup based on ID
-            self.tag_idmap[tid] = tag
+            for child in pending_children.pop(name, []):
+                child.set_parent(name)
 
         self.tagfile_loaded = True
 
@@ -263,11 +283,12 @@ class DataStore():
         """Load saved searches tree."""
 
         for element in search_tree.iter('savedSearch'):
-            tid = element.get('id')
-            name = element.get('name')
-            color = element.get('color')
-            icon = element.get('icon')
-            query = element.get('query')
+            get = element.get
+            tid = get('id')
+            name = get('name')
+            color = get('color')
+            icon = get('icon')
+            query = get('query')
 
             tag_attrs = {}
 
@@ -283,10 +304,7 @@ class DataStore():
     def get_tag_by_id(self, tid):
         """Get a tag by its ID"""
 
-        try:
-            return self.tag_idmap[tid]
-        except KeyError:
-            return
+        return self.tag_idmap.get(tid)
 
     def save_tagtree(self):
         """ Saves the tag tree to an XML file """
@@ -408,10 +426,7 @@ class DataStore():
         @returns GTG.core.datastore.TaskSource or None: the requested backend,
                                                         or None
         """
-        if backend_id in self.backends:
-            return self.backends[backend_id]
-        else:
-            return None
+        return self.backends.get(backend_id)
 
     def register_backend(self, backend_dic):
         """
@@ -677,6 +692,9 @@ class TaskSource():
         self.tasktree = datastore.get_tasks_tree().get_main_view()
         self.to_set = deque()
         self.to_remove = deque()
+        # Ids in the queues above, for constant time membership tests
+        self._to_set_ids = set()
+        self._to_remove_ids = set()
         self.please_quit = False
         self.task_filter = self.get_task_filter_for_backend()
         if log.isEnabledFor(logging.DEBUG):
@@ -747,7 +765,9 @@ class TaskSource():
         @param path: its path in TreeView widget => not used there
         """
         if self.should_task_id_be_stored(tid):
-            if tid not in self.to_set and tid not in self.to_remove:
+            if tid not in self._to_set_ids and \
+                    tid not in self._to_remove_ids:
+                self._to_set_ids.add(tid)
                 self.to_set.appendleft(tid)
                 self.__try_launch_setting_thread()
         else:
@@ -769,10 +789,11 @@ class TaskSource():
                 tid = self.to_set.pop()
             except IndexError:
                 break
+            self._to_set_ids.discard(tid)
             # we check that the task is not already marked for deletion
             # and that it's still to be stored in this backend
             # NOTE: no need to lock, we're reading
-            if tid not in self.to_remove and \
+            if tid not in self._to_remove_ids and \
                     self.should_task_id_be_stored(tid) and \
                     self.req.has_task(tid):
                 task = self.req.get_task(tid)
@@ -782,6 +803,7 @@ class TaskSource():
                 tid = self.to_remove.pop()
             except IndexError:
                 break
+            self._to_remove_ids.discard(tid)
             self.backend.queue_remove_task(tid)
         # we release the weak lock
         self.to_set_timer = None
@@ -793,7 +815,8 @@ class TaskSource():
         @param sender: not used, any value will do
         @param tid: The Task ID of the task to be removed
         """
-        if tid not in self.to_remove:
+        if tid not in self._to_remove_ids:
+            self._to_remove_ids.add(tid)
             self.to_remove.appendleft(tid)
             self.__try_launch_setting_thread()
 
@@ -95,11 +95,12 @@ class Date():
       - a datetime.date or Date instance, or
       - a string containing a locale format date.
     """
-    _cached_date = None
-    _real_date = None
-    _fuzzy = None
+    __slots__ = ('_cached_date', '_real_date', '_fuzzy')
 
     def __init__(self, value=''):
+        self._cached_date = None
+        self._real_date = None
+        self._fuzzy = None
         self._parse_init_value(value)
 
     def _parse_init_value(self, value):
@@ -142,6 +143,10 @@ class Date():
         """ Map date into real date, i.e. convert fuzzy dates """
         return self._cached_date
 
+    def _key(self):
+        """ Key used to compare dates: the real date, then the fuzziness """
+        return (self._cached_date, self._fuzzy is not None)
+
     def __add__(self, other):
         if isinstance(other, datetime.timedelta):
             return Date(self.date() + other)
@@ -164,13 +169,8 @@ class Date():
     def __lt__(self, other):
         """ Judge whehter less than other Date instance """
         if isinstance(other, Date):
-            # Keep fuzzy dates below normal dates
-            if self.date() == other.date():
-                if not self.is_fuzzy() and other.is_fuzzy():
-                    return True
-                else:
-                    return False
-            return self.date() < other.date()
+            # Fuzzy dates sort after normal dates on the same day
+            return self._key() < other._key()
         elif isinstance(other, datetime.date):
             return self.date() < other
         else:
@@ -179,13 +179,8 @@ class Date():
     def __le__(self, other):
         """ Judge whehter less than or equal to other Date instance """
         if isinstance(other, Date):
-            # Keep fuzzy dates below normal dates
-            if self.date() == other.date():
-                if self.is_fuzzy() and not other.is_fuzzy():
-                    return False
-                else:
-                    return True
-            return self.date() <= other.date()
+            # Fuzzy dates sort after normal dates on the same day
+            return self._key() <= other._key()
         elif isinstance(other, datetime.date):
             return self.date() <= other
         else:
@@ -194,11 +189,8 @@ class Date():
     def __eq__(self, other):
         """ Judge whehter equal to other Date instance """
         if isinstance(other, Date):
-            # Handle fuzzy dates situations
-            if self.date() == other.date():
-                return self.is_fuzzy() == other.is_fuzzy()
-            else:
-                return False
+            # Same day but different fuzziness is not the same date
+            return self._key() == other._key()
         elif isinstance(other, datetime.date):
             return self.date() == other
         else:
@@ -207,11 +199,8 @@ class Date():
     def __ne__(self, other):
         """ Judge whehter not equal to other Date instance """
         if isinstance(other, Date):
-            # Handle fuzzy dates situations
-            if self.date() == other.date():
-                return self.is_fuzzy() != other.is_fuzzy()
-            else:
-                return True
+            # Same day but different fuzziness is not the same date
+            return self._key() != other._key()
         elif isinstance(other, datetime.date):
             return self.date() != other
         else:
@@ -220,13 +209,8 @@ class Date():
     def __gt__(self, other):
         """ Judge whehter greater than other Date instance """
         if isinstance(other, Date):
-            # Keep fuzzy dates below normal dates
-            if self.date() == other.date():
-                if self.is_fuzzy() and not other.is_fuzzy():
-                    return True
-                else:
-                    return False
-            return self.date() > other.date()
+            # Fuzzy dates sort after normal dates on the same day
+            return self._key() > other._key()
         elif isinstance(other, datetime.date):
             return self.date() > other
         else:
@@ -235,13 +219,8 @@ class Date():
     def __ge__(self, other):
         """ Judge whehter greater than or equal to other Date instance """
         if isinstance(other, Date):
-            # Keep fuzzy dates below normal dates
-            if self.date() == other.date():
-                if not self.is_fuzzy() and other.is_fuzzy():
-                    return False
-                else:
-                    return True
-            return self.date() >= other.date()
+            # Fuzzy dates sort after normal dates on the same day
+            return self._key() >= other._key()
         elif isinstance(other, datetime.date):
             return self.date() >= other
         else:
@@ -268,10 +247,11 @@ class Date():
 
     def __getattr__(self, name):
         """ Provide access to the wrapped datetime.date """
-        try:
-            return self.__dict__[name]
-        except KeyError:
-            return getattr(self.date(), name)
+        # Private and special names are never delegated. This also keeps
+        # copy/pickle from recursing on instances without slots set yet.
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.date(), name)
 
     def is_fuzzy(self):
         """
@@ -285,7 +265,8 @@ class Date():
         if self._fuzzy == NODATE:
             return None
         else:
-            return (self.date() - datetime.date.today()).days
+            # Plain integer arithmetic, no timedelta to build
+            return self.date().toordinal() - datetime.date.today().toordinal()
 
     @classmethod
     def today(cls):
@@ -243,56 +243,60 @@ def parse_search_query(query):
     return {'q': commands}
 
 
+def _fulltext_search(task, word):
+    """ check if task contains the word """
+    word = word.lower()
+    text = task.get_excerpt(strip_tags=False).lower()
+    title = task.get_title().lower()
+
+    return word in text or word in title
+
+
+# Checks for the search commands taking (at most) a single value
+VALUE_CHECKS = {
+    'after': lambda task, v: task.get_due_date() > v,
+    'before': lambda task, v: task.get_due_date() < v,
+    'tag': lambda task, v: v in task.get_tags_name(),
+    'word': _fulltext_search,
+    'today': lambda task, v: task.get_due_date() == Date.today(),
+    'tomorrow': lambda task, v: task.get_due_date() == Date.tomorrow(),
+    'nodate': lambda task, v: task.get_due_date() == Date.no_date(),
+    'now': lambda task, v: task.get_due_date() == Date.now(),
+    'soon': lambda task, v: task.get_due_date() == Date.soon(),
+    'someday': lambda task, v: task.get_due_date() == Date.someday(),
+    'notag': lambda task, v: task.get_tags() == [],
+}
+
+
+def _check_commands(task, commands_list):
+    """ Execute search commands
+
+    This method is recursive for !or and !and """
+
+    for command in commands_list:
+        cmd, positive, args = command[0], command[1], command[2:]
+        result = False
+
+        if cmd == 'or':
+            for sub_cmd in args[0]:
+                if _check_commands(task, [sub_cmd]):
+                    result = True
+                    break
+        elif cmd in VALUE_CHECKS:
+            if len(args) > 0:
+                args = args[0]
+            result = VALUE_CHECKS[cmd](task, args)
+
+        if (positive and not result) or (not positive and result):
+            return False
+
+    return True
+
+
 def search_filter(task, parameters=None):
     """ Check if task satisfies all search parameters """
 
     if parameters is None or 'q' not in parameters:
         return False
 
-    def check_commands(commands_list):
-        """ Execute search commands
-
-        This method is recursive for !or and !and """
-
-        def fulltext_search(task, word):
-            """ check if task contains the word """
-            word = word.lower()
-            text = task.get_excerpt(strip_tags=False).lower()
-            title = task.get_title().lower()
-
-            return word in text or word in title
-
-        value_checks = {
-            'after': lambda t, v: task.get_due_date() > v,
-            'before': lambda t, v: task.get_due_date() < v,
-            'tag': lambda t, v: v in task.get_tags_name(),
-            'word': fulltext_search,
-            'today': lambda task, v: task.get_due_date() == Date.today(),
-            'tomorrow': lambda task, v: task.get_due_date() == Date.tomorrow(),
-            'nodate': lambda task, v: task.get_due_date() == Date.no_date(),
-            'now': lambda task, v: task.get_due_date() == Date.now(),
-            'soon': lambda task, v: task.get_due_date() == Date.soon(),
-            'someday': lambda task, v: task.get_due_date() == Date.someday(),
-            'notag': lambda task, v: task.get_tags() == [],
-        }
-
-        for command in commands_list:
-            cmd, positive, args = command[0], command[1], command[2:]
-            result = False
-
-            if cmd == 'or':
-                for sub_cmd in args[0]:
-                    if check_commands([sub_cmd]):
-                        result = True
-                        break
-            elif value_checks.get(cmd, None):
-                if len(args) > 0:
-                    args = args[0]
-                result = value_checks[cmd](task, args)
-
-            if (positive and not result) or (not positive and result):
-                return False
-
-        return True
-
-    return check_commands(parameters['q'])
+    return _check_commands(task, parameters['q'])
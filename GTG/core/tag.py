@@ -28,7 +28,6 @@ import xml.sax.saxutils as saxutils
 import re
 
 from liblarch import TreeNode
-from functools import reduce
 
 # Tags with special meaning
 ALLTASKS_TAG = "gtg-tags-all"
@@ -95,7 +94,7 @@ class Tag(TreeNode):
         if tid:
             self.tid = tid
         else:
-            self.tid = uuid.uuid4()
+            self.tid = str(uuid.uuid4())
 
     def __get_viewcount(self):
         if not self.viewcount and self.get_name() != "gtg-tags-sep":
@@ -183,8 +182,7 @@ class Tag(TreeNode):
             if self.has_parent():
                 parents_id = self.get_parents()
                 if len(parents_id) > 0:
-                    to_return = reduce(lambda a, b: f"{a},{b}",
-                                       parents_id)
+                    to_return = ','.join(parents_id)
         elif att_name == 'label':
             to_return = self._attributes.get(att_name, self.get_id())
         else:
@@ -194,12 +192,10 @@ class Tag(TreeNode):
     def del_attribute(self, att_name):
         """Deletes the attribute C{att_name}.
         """
-        if att_name not in self._attributes:
+        if att_name in ['name', 'parent']:
             return
-        elif att_name in ['name', 'parent']:
+        elif self._attributes.pop(att_name, None) is None:
             return
-        else:
-            del self._attributes[att_name]
         if self._save:
             self._save()
         self.modified()
@@ -212,7 +208,7 @@ class Tag(TreeNode):
             names.
         @param withparent: If True, the "parent" attribute is attached
         """
-        attributes = list(self._attributes.keys())
+        attributes = list(self._attributes)
         if butname:
             attributes.remove('name')
         if withparent:
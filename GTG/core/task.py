@@ -35,6 +35,9 @@ from liblarch import TreeNode
 
 log = logging.getLogger(__name__)
 
+# Matches subtask references ({!tid!}) in the task content
+SUBTASK_REGEX = re.compile(r'\{!.+?!\}')
+
 
 class Task(TreeNode):
     """ This class represent a task in GTG.
@@ -50,10 +53,9 @@ class Task(TreeNode):
         super().__init__(task_id)
         # the id of this task in the project should be set
         # tid is a string ! (we have to choose a type and stick to it)
-        assert(isinstance(task_id, str) or isinstance(task_id, str))
-        self.tid = str(task_id)
+        assert(isinstance(task_id, str))
+        self.tid = task_id
         self.set_uuid(task_id)
-        self.remote_ids = {}
         self.content = ""
         if Task.DEFAULT_TASK_NAME is None:
             Task.DEFAULT_TASK_NAME = _("My new task")
@@ -62,17 +64,13 @@ class Task(TreeNode):
         self.status = self.STA_ACTIVE
 
         self.added_date = Date.no_date()
-        if newtask:
-            self.added_date = datetime.now()
-
         self.closed_date = Date.no_date()
         self.due_date = Date.no_date()
         self.start_date = Date.no_date()
         self.can_be_deleted = newtask
-        # tags
-        self.tags = []
+        # tags names, in a dict for fast lookups (values are unused)
+        self.tags = {}
         self.req = requester
-        self.__main_treeview = requester.get_main_view()
         # If we don't have a newtask, we will have to load it.
         self.loaded = newtask
         # Should not be necessary with the new backends
@@ -80,6 +78,9 @@ class Task(TreeNode):
 #            self.req._task_loaded(self.tid)
         self.attributes = {}
         self._modified_update()
+        if newtask:
+            # Reuse the timestamp instead of asking the clock again
+            self.added_date = self.last_modified
 
         # Setting the attributes related to repeating tasks.
         self.recurring_term = None
@@ -118,7 +119,7 @@ class Task(TreeNode):
         return self.can_be_deleted
 
     def get_id(self):
-        return str(self.tid)
+        return self.tid
 
     def set_uuid(self, value):
         self.uuid = str(value)
@@ -130,7 +131,7 @@ class Task(TreeNode):
         if self.uuid == "":
             self.set_uuid(uuid.uuid4())
             self.sync()
-        return str(self.uuid)
+        return self.uuid
 
     def get_title(self):
         return self.title
@@ -145,7 +146,7 @@ class Task(TreeNode):
 
         copy.set_title(self.title)
         copy.content = self.content
-        copy.tags = self.tags
+        copy.tags = dict(self.tags)
         log.debug("Duppicating task %s as task %s",
                   self.get_id(), copy.get_id())
         return copy
@@ -268,10 +269,14 @@ class Task(TreeNode):
 
     def recursive_sync(self):
         """Recursively sync the task and all task children. Defined"""
-        self.sync()
-        for sub_id in self.children:
-            sub = self.req.get_task(sub_id)
-            sub.recursive_sync()
+        # Walk the subtree with a stack instead of recursing, in the same
+        # (depth-first) order
+        stack = [self]
+        while stack:
+            task = stack.pop()
+            task.sync()
+            stack.extend(self.req.get_task(sub_id)
+                         for sub_id in reversed(task.children))
 
     # ABOUT RECURRING TASKS
     # Like anything related to dates, repeating tasks are subtle and complex
@@ -498,35 +503,38 @@ class Task(TreeNode):
                     child_list.append(child)
             return child_list
 
-        old_due_date = self.due_date
-        new_duedate_obj = Date(new_duedate)  # caching the conversion
-        self.due_date = new_duedate_obj
+        # Parse the value once, related tasks get the already built Date
+        new_duedate = Date(new_duedate)
+
+        # Constraints were already applied when the date was set
+        if new_duedate == self.due_date:
+            return
+
+        self.due_date = new_duedate
         # If the new date is fuzzy or undefined, we don't update related tasks
-        if not new_duedate_obj.is_fuzzy():
+        if not new_duedate.is_fuzzy():
             # if some ancestors' due dates happen before the task's new
             # due date, we update them (except for fuzzy dates)
             for par in __get_defined_parent_list(self):
-                if par.get_due_date() < new_duedate_obj:
+                if par.get_due_date() < new_duedate:
                     par.set_due_date(new_duedate)
             # we must apply the constraints to the defined & non-fuzzy children
             # as well
             for sub in __get_defined_child_list(self):
-                sub_duedate = sub.get_due_date()
                 # if the child's due date happens later than the task's: we
                 # update it to the task's new due date
-                if sub_duedate > new_duedate_obj:
+                if sub.get_due_date() > new_duedate:
                     sub.set_due_date(new_duedate)
                 # if the child's start date happens later than
                 # the task's new due date, we update it
                 # (except for fuzzy start dates)
                 sub_startdate = sub.get_start_date()
                 if not sub_startdate.is_fuzzy() and \
-                        sub_startdate > new_duedate_obj:
+                        sub_startdate > new_duedate:
                     sub.set_start_date(new_duedate)
-        # If the date changed, we notify the change for the children since the
+        # The date changed, we notify the change for the children since the
         # constraints might have changed
-        if old_due_date != new_duedate_obj:
-            self.recursive_sync()
+        self.recursive_sync()
 
     def get_due_date(self):
         """ Returns the due date, which always respects all constraints """
@@ -634,14 +642,13 @@ class Task(TreeNode):
             txt = saxutils.escape(txt)
             txt = txt.strip()
 
-            if strip_tags:
-                for tag in self.get_tags_name():
-                    txt = (txt.replace(f'@{tag}, ', '')
-                              .replace(f'@{tag},', '')
-                              .replace(f'@{tag}', ''))
+            if strip_tags and self.tags:
+                tags = '|'.join(re.escape(f'@{tag}')
+                                for tag in self.get_tags_name())
+                txt = re.sub(f'(?:{tags})(?:, ?)?', '', txt)
 
             if strip_subtasks:
-                txt = re.sub(r'\{\!.+\!\}', '', txt)
+                txt = SUBTASK_REGEX.sub('', txt)
 
             # Strip blank lines and get desired amount of lines
             txt = [l for l in txt.splitlines() if l]
@@ -688,7 +695,7 @@ class Task(TreeNode):
 
         @param child: the added task
         """
-        log.debug("adding child %s to task %s", tid, self.get_id())
+        log.debug("adding child %s to task %s", tid, self.tid)
         self.can_be_deleted = False
         # the core of the method is in the TreeNode object
         TreeNode.add_child(self, tid)
@@ -811,7 +818,7 @@ class Task(TreeNode):
         Adds a tag. Does not add '@tag' to the contents. See add_tag
         """
         if tagname not in self.tags:
-            self.tags.append(tagname)
+            self.tags[tagname] = None
             if self.is_loaded():
                 for child in self.get_subtasks():
                     if child.can_be_deleted:
@@ -829,7 +836,8 @@ class Task(TreeNode):
         if self.tag_added(tagname):
             c = self.content
             tagname = html.escape(tagname)
-            tagname = '@' + tagname if not tagname.startswith('@') else tagname
+            if not tagname.startswith('@'):
+                tagname = '@' + tagname
 
             if not c:
                 # don't need a separator if it's the only text
@@ -849,59 +857,52 @@ class Task(TreeNode):
 
     # remove by tagname
     def remove_tag(self, tagname):
-        modified = False
-        if tagname in self.tags:
-            self.tags.remove(tagname)
-            modified = True
+        modified = tagname in self.tags
+        if modified:
+            del self.tags[tagname]
             for child in self.get_subtasks():
                 if child.can_be_deleted:
                     child.remove_tag(tagname)
         self.content = self._strip_tag(self.content, tagname)
         if modified:
             tag = self.req.get_tag(tagname)
-            # The ViewCount of the tag still doesn't know that
-            # the task was removed. We need to update manually
-            tag.update_task(self.get_id())
             if tag:
+                # The ViewCount of the tag still doesn't know that
+                # the task was removed. We need to update manually
+                tag.update_task(self.tid)
                 tag.modified()
 
     def _strip_tag(self, text, tagname, newtag=''):
-        if tagname.startswith('@'):
-            inline_tag = tagname[1:]
-        else:
-            inline_tag = tagname
-
-        return (text
-                .replace(f'@{tagname}\n\n', newtag)
-                .replace(f'@{tagname}\n', newtag)
-                .replace(f'@{tagname}, ', newtag)
-                .replace(f'@{tagname}', newtag)
-                .replace(f'{tagname}\n\n', newtag)
-                .replace(f'{tagname}, ', newtag)
-                .replace(f'{tagname},', inline_tag)
-                # don't forget a space a the end
-                .replace(f'{tagname}', inline_tag))
+        inline_tag = tagname[1:] if tagname.startswith('@') else tagname
+        tag = re.escape(tagname)
+
+        # Tags followed by a comma, space or blank lines are removed,
+        # bare ones are kept as plain words
+        pattern = f'(@{tag}(?:\n\n|\n|, )?|{tag}(?:\n\n|, ))|{tag},?'
+
+        return re.sub(pattern,
+                      lambda m: newtag if m.group(1) else inline_tag,
+                      text)
 
     # tag_list is a list of tags names
     # return true if at least one of the list is in the task
     def has_tags(self, tag_list=None, notag_only=False):
-        # recursive function to explore the tags and its children
+        # explore the tag and its children, without recursing
         def children_tag(tagname):
-            toreturn = False
-            if tagname in self.tags:
-                toreturn = True
-            else:
+            stack = [tagname]
+            while stack:
+                tagname = stack.pop()
+                if tagname in self.tags:
+                    return True
                 tag = self.req.get_tag(tagname)
                 if tag:
-                    for tagc_name in tag.get_children():
-                        if not toreturn:
-                            toreturn = children_tag(tagc_name)
-            return toreturn
+                    stack.extend(tag.get_children())
+            return False
 
         # We want to see if the task has no tags
         toreturn = False
         if notag_only:
-            toreturn = self.tags == []
+            toreturn = not self.tags
         # Here, the user ask for the "empty" tag
         # And virtually every task has it.
         elif tag_list == [] or tag_list is None:
@@ -920,6 +921,6 @@ class Task(TreeNode):
                 self.title,
                 self.tid,
                 self.status,
-                str(self.tags),
-                str(self.added_date),
-                str(self.recurring))
+                ', '.join(self.tags),
+                self.added_date,
+                self.recurring)
@@ -74,9 +74,8 @@ class BiDict():
 
         @param key: the first key
         """
-        second = self._first_to_second[first]
+        second = self._first_to_second.pop(first)
         del self._second_to_first[second]
-        del self._first_to_second[first]
 
     def _remove_by_second(self, second):
         """
@@ -84,9 +83,8 @@ class BiDict():
 
         @param key: the second key
         """
-        first = self._second_to_first[second]
+        first = self._second_to_first.pop(second)
         del self._first_to_second[first]
-        del self._second_to_first[second]
 
     def _get_all_first(self):
         """
@@ -75,12 +75,16 @@ def convert(path: str, ds: datastore) -> et.ElementTree:
 
         tid_cache[tid] = new_tid
 
-    for task in old_tree.iter('task'):
         new_task = convert_task(task, ds)
 
         if new_task is not None:
             tasklist.append(new_task)
 
+    # Subtasks can come after their parent, so they still hold their
+    # old IDs until all tasks have been seen
+    for sub in tasklist.iter('sub'):
+        sub.text = tid_cache[sub.text]
+
     return et.ElementTree(new_root)
 
 
@@ -88,12 +92,11 @@ def convert_tags(old_tree: et.Element) -> Tuple[et.Element, et.Element]:
     """Convert old tags for the new format."""
 
     old_file = os.path.join(DATA_DIR, 'tags.xml')
-    tree = xml.open_file(old_file, 'tagstore')
 
     taglist = et.Element('taglist')
     searchlist = et.Element('searchlist')
 
-    for tag in tree.iter('tag'):
+    for tag in xml.iter_elements(old_file, 'tag'):
         name = tag.get('name')
         parent = tag.get('parent')
         nonactionable = tag.get('nonworkview')
@@ -251,9 +254,10 @@ def convert_task(task: et.Element, ds: datastore) -> Optional[et.Element]:
 
     subtasks = et.SubElement(new_task, 'subtasks')
 
-    for sub in task.findall('subtask'):
+    for sub in task.iterfind('subtask'):
+        # Resolved to the new ID once all tasks are converted
         new_sub = et.SubElement(subtasks, 'sub')
-        new_sub.text = tid_cache[sub.text]
+        new_sub.text = sub.text
 
     new_content = et.SubElement(new_task, 'content')
 
@@ -17,12 +17,14 @@
 # -----------------------------------------------------------------------------
 
 import os
+import sys
 import shutil
 import logging
 from datetime import datetime
 from GTG.core.dates import Date
 
 from lxml import etree
+from lxml.builder import E
 
 log = logging.getLogger(__name__)
 # Total amount of backups
@@ -40,16 +42,15 @@ def task_from_element(task, element: etree.Element):
 
     dates = element.find('dates')
 
-    modified = dates.find('modified').text
-    task.set_modified(datetime.fromisoformat(modified))
-
     added = dates.find('added').text
     task.set_added_date(datetime.fromisoformat(added))
 
     # Dates
     try:
         done_date = Date.parse(dates.find('done').text)
-        task.set_status(element.attrib['status'], donedate=done_date, init=True)
+        # Interned so it is the same object as the Task.STA_* constants
+        status = sys.intern(element.attrib['status'])
+        task.set_status(status, donedate=done_date, init=True)
     except AttributeError:
         pass
 
@@ -99,84 +100,69 @@ def task_from_element(task, element: etree.Element):
     # Content
     content = element.find('content').text or ''
 
-    content = content.replace(']]&gt;', ']]>')
+    if ']]&gt;' in content:
+        content = content.replace(']]&gt;', ']]>')
     task.set_text(content)
 
     # Subtasks
     subtasks = element.find('subtasks')
 
-    for sub in subtasks.findall('sub'):
+    for sub in subtasks.iterfind('sub'):
         task.add_child(sub.text)
 
+    # The setters above stamp the task as modified now, so restore the
+    # saved date last
+    modified = dates.find('modified').text
+    task.set_modified(datetime.fromisoformat(modified))
+
     return task
 
 
 def task_to_element(task) -> etree.Element:
     """Serialize task into XML Element."""
 
-    element = etree.Element('task')
-
-    element.set('id', task.get_id())
-    element.set('status', task.get_status())
-    element.set('uuid', task.get_uuid())
-    element.set('recurring', str(task.get_recurring()))
-
-    tags = etree.SubElement(element, 'tags')
-
-    for t in task.get_tags():
-        tag_tag = etree.SubElement(tags, 'tag')
-        tag_tag.text = str(t.tid)
-
-    title = etree.SubElement(element, 'title')
-    title.text = task.get_title()
-
-    dates = etree.SubElement(element, 'dates')
-
-    added_date = etree.SubElement(dates, 'added')
-    added_date.text = task.get_added_date().isoformat()
-
-    modified_date = etree.SubElement(dates, 'modified')
-    modified_date.text = Date(task.get_modified()).xml_str()
-
-    done_date = etree.SubElement(dates, 'done')
-    done_date.text = task.get_closed_date().xml_str()
-
     due_date = task.get_due_date()
-    due_tag = 'fuzzyDue' if due_date.is_fuzzy() else 'due'
-    due = etree.SubElement(dates, due_tag)
-    due.text = due_date.xml_str()
-
     start_date = task.get_start_date()
-    start_tag = 'fuzzyStart' if start_date.is_fuzzy() else 'start'
-    start = etree.SubElement(dates, start_tag)
-    start.text = start_date.xml_str()
-
-    recurring = etree.SubElement(element, 'recurring')
-    recurring.set('enabled', str(task.recurring).lower())
+    recurring = str(task.get_recurring())
 
-    recurring_term = etree.SubElement(recurring, 'term')
-    recurring_term.text = str(task.get_recurring_term())
-
-    recurring_updated_date = etree.SubElement(recurring, 'updated_date')
+    recurring_updated_date = E.updated_date()
     if date := task.get_recurring_updated_date():
         recurring_updated_date.text = date.isoformat()
 
-    subtasks = etree.SubElement(element, 'subtasks')
-
-    for subtask_id in task.get_children():
-        sub = etree.SubElement(subtasks, 'sub')
-        sub.text = subtask_id
-
-    content = etree.SubElement(element, 'content')
     text = task.get_text()
 
     # Poor man's encoding.
     # CDATA's only poison is this combination of characters.
-    text = text.replace(']]>', ']]&gt;')
-
-    content.text = etree.CDATA(text)
-
-    return element
+    if ']]>' in text:
+        text = text.replace(']]>', ']]&gt;')
+
+    # Build the whole subtree at once with the element factory
+    return E.task(
+        {
+            'id': task.get_id(),
+            'status': task.get_status(),
+            'uuid': task.get_uuid(),
+            'recurring': recurring,
+        },
+        E.tags(*[E.tag(t.tid) for t in task.get_tags()]),
+        E.title(task.get_title()),
+        E.dates(
+            E.added(task.get_added_date().isoformat()),
+            E.modified(task.get_modified().isoformat()),
+            E.done(task.get_closed_date().xml_str()),
+            E('fuzzyDue' if due_date.is_fuzzy() else 'due',
+              due_date.xml_str()),
+            E('fuzzyStart' if start_date.is_fuzzy() else 'start',
+              start_date.xml_str()),
+        ),
+        E.recurring(
+            {'enabled': recurring.lower()},
+            E.term(str(task.get_recurring_term())),
+            recurring_updated_date,
+        ),
+        E.subtasks(*[E.sub(tid) for tid in task.get_children()]),
+        E.content(etree.CDATA(text)),
+    )
 
 
 def get_file_mtime(filepath: str) -> str:
@@ -206,6 +192,31 @@ def get_xml_tree(filepath: str) -> etree.ElementTree:
     return tree
 
 
+def iter_elements(filepath: str, tag: str):
+    """Iterate over the elements named tag in the XML file at filepath.
+
+    The file is parsed incrementally and elements are freed once the
+    caller is done with them, so memory use doesn't grow with the size
+    of the file. Missing or unreadable files yield nothing."""
+
+    try:
+        for _, element in etree.iterparse(filepath, tag=tag,
+                                          remove_blank_text=True,
+                                          strip_cdata=False):
+            yield element
+
+            # Free the element and the siblings already processed
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    except (FileNotFoundError, PermissionError) as error:
+        log.debug('Could not open %r: %r', filepath, error)
+
+    except etree.XMLSyntaxError as error:
+        log.error('Syntax error in %r: %r', filepath, error)
+
+
 def open_file(xml_path: str, root_tag: str) -> etree.ElementTree:
     """Open an XML file in a robust way
 
@@ -521,7 +521,7 @@ class Application(Gtk.Application):
 
         open_task = []
 
-        for otid in list(self.open_tasks.keys()):
+        for otid in list(self.open_tasks):
             open_task.append(otid)
             self.open_tasks[otid].close()
 
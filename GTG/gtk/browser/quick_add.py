@@ -65,7 +65,7 @@ def parse(text: str) -> Dict:
         'recurring': None
     }
 
-    for match in re.finditer(TAG_REGEX, text):
+    for match in TAG_REGEX.finditer(text):
         data = match.group(0)
         result['tags'].add(data[1:])
 
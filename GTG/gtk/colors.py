@@ -18,12 +18,13 @@
 
 from gi.repository import Gdk
 from functools import reduce
-import random
+from itertools import count
+import colorsys
 
 # Take list of Tags and give the background color that should be applied
 # The returned color might be None (in which case, the default is used)
 
-used_color = []
+used_color = set()
 
 
 def background_color(tags, bgcolor=None):
@@ -37,8 +38,8 @@ def background_color(tags, bgcolor=None):
     blue = 0
     for my_tag in tags:
         my_color_str = my_tag.get_attribute("color")
-        if my_color_str is not None and my_color_str not in used_color:
-            used_color.append(my_color_str)
+        if my_color_str is not None:
+            used_color.add(my_color_str)
         if my_color_str:
             my_color = Gdk.color_parse(my_color_str)
             color_count = color_count + 1
@@ -95,29 +96,40 @@ def get_colored_tags_markup(req, tag_names):
     return tags_txt
 
 
+def _tag_color_palette():
+    """
+    Yield tag colors whose hues are spread around the color wheel by
+    stepping with the golden ratio, so consecutive colors stay distinct
+    """
+    golden_ratio = 0.618033988749895
+    maxvalue = 65535
+
+    for i in count():
+        hue = (i * golden_ratio) % 1.0
+        red, green, blue = colorsys.hsv_to_rgb(hue, 0.5, 0.95)
+        yield Gdk.Color(int(red * maxvalue),
+                        int(green * maxvalue),
+                        int(blue * maxvalue)).to_string()
+
+
+_palette = _tag_color_palette()
+
+
 def generate_tag_color():
 
-    maxvalue = 65535
-    flag = 0
-    while(flag == 0):
-        red = random.randint(0, maxvalue)
-        green = random.randint(0, maxvalue)
-        blue = random.randint(0, maxvalue)
-        my_color = Gdk.Color(red, green, blue).to_string()
-        if my_color not in used_color:
-            flag = 1
-    used_color.append(my_color)
+    my_color = next(_palette)
+    while my_color in used_color:
+        my_color = next(_palette)
+    used_color.add(my_color)
     return my_color
 
 
 def color_add(present_color):
 
-    if present_color not in used_color:
-        used_color.append(present_color)
+    used_color.add(present_color)
 
 
 def color_remove(present_color):
 
-    if present_color in used_color:
-        used_color.remove(present_color)
+    used_color.discard(present_color)
 # -----------------------------------------------------------------------------
@@ -42,7 +42,9 @@ log = logging.getLogger(__name__)
 # Regex to find GTG's tags.
 # GTG Tags start with @ and can contain alphanumeric
 # characters and/or dashes
-TAG_REGEX = re.compile(r'\B\@\w+([\-\w+\.\+\%\$\\(\)\[\]\{\}\^\=\/\*])*')
+# The first character after @ must be a word character; the single
+# class after it avoids a capture group per character.
+TAG_REGEX = re.compile(r'\B@\w[\w\-+.%$\\()\[\]{}^=/*]*')
 
 # Regex to find internal links
 # Starts with gtg:// followed by a UUID.
@@ -136,12 +138,12 @@ class TaskView(Gtk.TextView):
         self.tags_applied = []
 
         # Keep track of subtasks in this task. Tags keeps all the subtask tags
-        # applied in the buffer, while 'to_delete' is a temporary list used in
+        # applied in the buffer, while 'to_delete' is a temporary set used in
         # process() to determine which subtasks we have to delete from the
         # task.
         self.subtasks = {
-            'tags': [],
-            'to_delete': []
+            'tags': set(),
+            'to_delete': set()
         }
 
         # Signals and callbacks
@@ -278,7 +280,7 @@ class TaskView(Gtk.TextView):
             self.table.add(subtask_tag)
             self.buffer.apply_tag(subtask_tag, start, end)
 
-            self.subtasks['tags'].append(tid)
+            self.subtasks['tags'].add(tid)
             return True
 
         # A subtask already exists
@@ -336,10 +338,7 @@ class TaskView(Gtk.TextView):
                     return False
 
 
-            try:
-                self.subtasks['to_delete'].remove(tid)
-            except ValueError:
-                pass
+            self.subtasks['to_delete'].discard(tid)
 
             self.rename_subtask_cb(tid, text)
 
@@ -374,7 +373,7 @@ class TaskView(Gtk.TextView):
         task = self.req.get_task(tid)
 
         if not task:
-            log.warn('Failed to toggle status for %s', tid)
+            log.warning('Failed to toggle status for %s', tid)
             return
 
         task.toggle_status()
@@ -410,7 +409,7 @@ class TaskView(Gtk.TextView):
         """Detect GTGs tags and applies text tags to them."""
 
         # Find all matches
-        matches = re.finditer(TAG_REGEX, text)
+        matches = TAG_REGEX.finditer(text)
 
         # Go through each with its own iterator and tag 'em
         for match in matches:
@@ -848,7 +847,7 @@ class TaskView(Gtk.TextView):
         self.table.add(subtask_tag)
         self.buffer.apply_tag(subtask_tag, start, end)
 
-        self.subtasks['tags'].append(tid)
+        self.subtasks['tags'].add(tid)
 
 
     # --------------------------------------------------------------------------
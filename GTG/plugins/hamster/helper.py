@@ -56,7 +56,7 @@ class FactBuilder():
             # See if any of the tags match existing categories
             categories = dict([(str(x[1]).lower(), str(x[1]))
                                for x in self.hamster.GetCategories()])
-            intersection = set(categories.keys()).intersection(set(gtg_tags))
+            intersection = set(categories).intersection(gtg_tags)
             if len(intersection) > 0:
                 category = f"{categories[intersection.pop()]}"
             elif len(gtg_tags) > 0:
@@ -0,0 +1,52 @@
+# -----------------------------------------------------------------------------
+# Getting Things GNOME! - a personal organizer for the GNOME desktop
+# Copyright (c) 2008-2014 - Lionel Dricot & Bertrand Rousseau
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+# -----------------------------------------------------------------------------
+
+from unittest import TestCase
+
+from GTG.core.twokeydict import TwoKeyDict
+
+
+class TestTwoKeyDict(TestCase):
+    def setUp(self):
+        self.dict = TwoKeyDict(('1', 'I', 'one'), ('2', 'II', 'two'))
+
+    def test_get_by_either_key(self):
+        self.assertEqual('one', self.dict._get_by_primary('1'))
+        self.assertEqual('two', self.dict._get_by_secondary('II'))
+        self.assertEqual('I', self.dict._get_secondary_key('1'))
+        self.assertEqual('2', self.dict._get_primary_key('II'))
+
+    def test_remove_by_primary(self):
+        self.dict._remove_by_primary('1')
+        self.assertEqual(['2'], self.dict._get_all_primary_keys())
+        self.assertEqual(['II'], self.dict._get_all_secondary_keys())
+
+        with self.assertRaises(KeyError):
+            self.dict._get_by_secondary('I')
+
+    def test_remove_by_secondary(self):
+        self.dict._remove_by_secondary('II')
+        self.assertEqual(['1'], self.dict._get_all_primary_keys())
+        self.assertEqual(['I'], self.dict._get_all_secondary_keys())
+
+        with self.assertRaises(KeyError):
+            self.dict._get_by_primary('2')
+
+    def test_remove_missing_key_raises(self):
+        with self.assertRaises(KeyError):
+            self.dict._remove_by_primary('3')
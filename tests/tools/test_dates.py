@@ -16,6 +16,7 @@
 # this program.  If not, see <http://www.gnu.org/licenses/>.
 # -----------------------------------------------------------------------------
 
+from copy import copy
 from datetime import date, timedelta
 from unittest import TestCase
 
@@ -53,6 +54,23 @@ class TestDates(TestCase):
         today = date.today()
         self.assertEqual(Date(today), today)
 
+    def test_exposes_wrapped_date_attributes(self):
+        aday = Date("1985-03-29")
+        self.assertEqual((aday.year, aday.month, aday.day), (1985, 3, 29))
+        self.assertEqual(aday.weekday(), date(1985, 3, 29).weekday())
+
+    def test_copy_keeps_value(self):
+        self.assertEqual(copy(Date("1985-03-29")), date(1985, 3, 29))
+        self.assertEqual(copy(Date.soon()), Date.soon())
+
+    def test_days_left(self):
+        today = date.today()
+        self.assertEqual(Date(today).days_left(), 0)
+        self.assertEqual(Date(today + timedelta(3)).days_left(), 3)
+        self.assertEqual(Date(today - timedelta(2)).days_left(), -2)
+        self.assertEqual(Date.soon().days_left(), 15)
+        self.assertIsNone(Date.no_date().days_left())
+
     def test_parse_fuzzy_dates(self):
         """ Parse fuzzy dates like now, soon, later, someday """
         self.assertEqual(Date.parse("now"), Date.now())